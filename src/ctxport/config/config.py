@@ -2,132 +2,193 @@
 Configuration dataclass
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, ClassVar, Optional
+from types import MappingProxyType
+from typing import AbstractSet, ClassVar, Dict, Mapping, Optional, Sequence
+
+
+def _interned(mapping: Dict[str, str]) -> Mapping[str, str]:
+    """Freeze a str-to-str mapping with interned keys and values.
+
+    Interned strings let dict lookups and language comparisons
+    short-circuit on pointer identity.
+    """
+    return MappingProxyType({
+        sys.intern(k): sys.intern(v) for k, v in mapping.items()
+    })
+
+
+# Shared, immutable defaults. Built once at module level so every Config
+# (and every merge that introduces no overrides) aliases the same objects
+# instead of rebuilding these literals.
+_DEFAULT_LANGUAGE_MAP: Mapping[str, str] = _interned({
+    '.py': 'python',
+    '.js': 'javascript',
+    '.jsx': 'jsx',
+    '.ts': 'typescript',
+    '.tsx': 'tsx',
+    '.html': 'html',
+    '.css': 'css',
+    '.scss': 'scss',
+    '.sass': 'sass',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+    '.md': 'markdown',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.zsh': 'zsh',
+    '.fish': 'fish',
+    '.ps1': 'powershell',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.cc': 'cpp',
+    '.cxx': 'cpp',
+    '.h': 'c',
+    '.hpp': 'cpp',
+    '.hxx': 'cpp',
+    '.rs': 'rust',
+    '.go': 'go',
+    '.java': 'java',
+    '.kt': 'kotlin',
+    '.swift': 'swift',
+    '.rb': 'ruby',
+    '.php': 'php',
+    '.sql': 'sql',
+    '.r': 'r',
+    '.R': 'r',
+    '.m': 'matlab',
+    '.jl': 'julia',
+    '.tex': 'latex',
+    '.xml': 'xml',
+    '.vue': 'vue',
+    '.svelte': 'svelte',
+})
+
+_DEFAULT_FILENAME_MAP: Mapping[str, str] = _interned({
+    'dockerfile': 'dockerfile',
+    'makefile': 'makefile',
+    'gnumakefile': 'makefile',
+    'rakefile': 'ruby',
+    'gemfile': 'ruby',
+    'vagrantfile': 'ruby',
+    'jenkinsfile': 'groovy',
+    'fastfile': 'ruby',
+    'procfile': 'yaml',
+    'podfile': 'ruby',
+    'cakefile': 'coffeescript',
+    'gulpfile': 'javascript',
+    'gruntfile': 'javascript',
+})
+
+_DEFAULT_TEXT_EXTENSIONS: AbstractSet[str] = frozenset({
+    '.txt', '.md', '.yml', '.yaml', '.json', '.xml', '.html', '.css',
+    '.js', '.jsx', '.ts', '.tsx', '.py', '.rb', '.php', '.java', '.cpp',
+    '.c', '.h', '.rs', '.go', '.sh', '.bash', '.zsh', '.fish', '.ps1',
+    '.dockerfile', '.gitignore', '.env', '.conf', '.cfg', '.ini',
+    '.toml', '.lock', '.sum', '.mod'
+})
+
+_DEFAULT_IGNORE_PATTERNS: Sequence[str] = (
+    '.git/',
+    '__pycache__/',
+    '*.pyc',
+    '*.pyo',
+    '*.pyd',
+    '.DS_Store',
+    '.vscode/',
+    '.idea/',
+    'node_modules/',
+    'venv/',
+    '.env/',
+    '*.min.js',
+    '*.min.css',
+)
 
 
 @dataclass
 class Config:
     """Configuration for Code Context Exporter"""
     # Language mappings for syntax highlighting by extension
-    language_map: Dict[str, str] = field(default_factory=dict)
-    
+    language_map: Mapping[str, str] = field(default_factory=dict)
+
     # Language mappings for specific filenames
-    filename_map: Dict[str, str] = field(default_factory=dict)
-    
+    filename_map: Mapping[str, str] = field(default_factory=dict)
+
     # Extensions considered as text files
-    text_extensions: Set[str] = field(default_factory=set)
-    
+    text_extensions: AbstractSet[str] = field(default_factory=set)
+
     # Ignore patterns
-    ignore_patterns: List[str] = field(default_factory=list)
-    
+    ignore_patterns: Sequence[str] = field(default_factory=list)
+
     # Default language to use when no mapping is found
     default_language: str = ""
     
     # Default configuration as class variable to avoid recreation
     DEFAULT_CONFIG: ClassVar[Optional['Config']] = None
-    
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the config carries no overrides at all"""
+        return not (
+            self.language_map
+            or self.filename_map
+            or self.text_extensions
+            or self.ignore_patterns
+            or self.default_language
+        )
+
     @classmethod
     def get_default_config(cls) -> 'Config':
         """Get the default configuration"""
         if cls.DEFAULT_CONFIG is None:
             cls.DEFAULT_CONFIG = Config(
-                language_map={
-                    '.py': 'python',
-                    '.js': 'javascript',
-                    '.jsx': 'jsx',
-                    '.ts': 'typescript',
-                    '.tsx': 'tsx',
-                    '.html': 'html',
-                    '.css': 'css',
-                    '.scss': 'scss',
-                    '.sass': 'sass',
-                    '.json': 'json',
-                    '.yaml': 'yaml',
-                    '.yml': 'yaml',
-                    '.md': 'markdown',
-                    '.sh': 'bash',
-                    '.bash': 'bash',
-                    '.zsh': 'zsh',
-                    '.fish': 'fish',
-                    '.ps1': 'powershell',
-                    '.c': 'c',
-                    '.cpp': 'cpp',
-                    '.cc': 'cpp',
-                    '.cxx': 'cpp',
-                    '.h': 'c',
-                    '.hpp': 'cpp',
-                    '.hxx': 'cpp',
-                    '.rs': 'rust',
-                    '.go': 'go',
-                    '.java': 'java',
-                    '.kt': 'kotlin',
-                    '.swift': 'swift',
-                    '.rb': 'ruby',
-                    '.php': 'php',
-                    '.sql': 'sql',
-                    '.r': 'r',
-                    '.R': 'r',
-                    '.m': 'matlab',
-                    '.jl': 'julia',
-                    '.tex': 'latex',
-                    '.xml': 'xml',
-                    '.vue': 'vue',
-                    '.svelte': 'svelte',
-                },
-                filename_map={
-                    'dockerfile': 'dockerfile',
-                    'makefile': 'makefile',
-                    'gnumakefile': 'makefile',
-                    'rakefile': 'ruby',
-                    'gemfile': 'ruby',
-                    'vagrantfile': 'ruby',
-                    'jenkinsfile': 'groovy',
-                    'fastfile': 'ruby',
-                    'procfile': 'yaml',
-                    'podfile': 'ruby',
-                    'cakefile': 'coffeescript',
-                    'gulpfile': 'javascript',
-                    'gruntfile': 'javascript',
-                },
-                text_extensions={
-                    '.txt', '.md', '.yml', '.yaml', '.json', '.xml', '.html', '.css',
-                    '.js', '.jsx', '.ts', '.tsx', '.py', '.rb', '.php', '.java', '.cpp',
-                    '.c', '.h', '.rs', '.go', '.sh', '.bash', '.zsh', '.fish', '.ps1',
-                    '.dockerfile', '.gitignore', '.env', '.conf', '.cfg', '.ini',
-                    '.toml', '.lock', '.sum', '.mod'
-                },
-                ignore_patterns=[
-                    '.git/',
-                    '__pycache__/',
-                    '*.pyc',
-                    '*.pyo',
-                    '*.pyd',
-                    '.DS_Store',
-                    '.vscode/',
-                    '.idea/',
-                    'node_modules/',
-                    'venv/',
-                    '.env/',
-                    '*.min.js',
-                    '*.min.css'
-                ]
+                language_map=_DEFAULT_LANGUAGE_MAP,
+                filename_map=_DEFAULT_FILENAME_MAP,
+                text_extensions=_DEFAULT_TEXT_EXTENSIONS,
+                ignore_patterns=_DEFAULT_IGNORE_PATTERNS,
             )
         return cls.DEFAULT_CONFIG
     
     def merge(self, other: 'Config') -> 'Config':
-        """Merge another config into this one, with other's values taking precedence"""
+        """Merge another config into this one, with other's values taking precedence
+
+        Merged configs are treated as read-only, so fields with no overrides
+        alias the existing containers instead of copying them. When either
+        side is entirely empty (the common no-override case), the other is
+        returned as-is with no new Config at all.
+        """
+        if other.is_empty:
+            return self
+        if self.is_empty:
+            return other
+
         merged = Config()
-        
-        merged.language_map = {**self.language_map, **other.language_map}
-        
-        merged.filename_map = {**self.filename_map, **other.filename_map}
-        
-        merged.text_extensions = self.text_extensions | other.text_extensions
-        
+
+        if other.language_map:
+            merged.language_map = {**self.language_map, **other.language_map}
+        else:
+            merged.language_map = self.language_map
+
+        if other.filename_map:
+            merged.filename_map = {**self.filename_map, **other.filename_map}
+        else:
+            merged.filename_map = self.filename_map
+
+        if other.text_extensions:
+            merged.text_extensions = self.text_extensions | other.text_extensions
+        else:
+            merged.text_extensions = self.text_extensions
+
         # Merge ignore patterns (preserve order and remove duplicates)
-        merged.ignore_patterns = list(dict.fromkeys(self.ignore_patterns + other.ignore_patterns))
-        
+        if other.ignore_patterns:
+            merged.ignore_patterns = list(
+                dict.fromkeys([*self.ignore_patterns, *other.ignore_patterns])
+            )
+        else:
+            merged.ignore_patterns = self.ignore_patterns
+
         merged.default_language = other.default_language or self.default_language
-        
+
         return merged
\ No newline at end of file
@@ -2,14 +2,23 @@
 Configuration management
 """
 
+import hashlib
 import json
 import os
+import pickle
 import sys
 import logging
+import tempfile
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from ctxport.config.config import Config
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class ConfigManager:
@@ -18,11 +27,17 @@ class ConfigManager:
     DEFAULT_CONFIG_NAME = '.ctxport.json'
     GLOBAL_CONFIG_NAME = 'ctxport.json'
     LEGACY_IGNORE_FILE = 'context.ignore'
+
+    # Bumped when the on-disk cache layout changes, so stale entries
+    # from older versions are simply never hit.
+    _DISK_CACHE_VERSION = 1
     
     def __init__(self):
         """Initialize the configuration manager"""
         self._global_config: Optional[Config] = None
         self._cached_configs: Dict[Path, Config] = {}
+        self._ancestor_configs: Dict[Path, Config] = {}
+        self._parsed_configs: Dict[Tuple[str, int, int], Config] = {}
     
     def _load_global_config(self) -> Config:
         """Load global configuration from user's home directory"""
@@ -50,99 +65,234 @@ class ConfigManager:
         self._global_config = Config()
         return self._global_config
     
-    def _load_config_file(self, path: Path) -> Config:
-        """Load configuration from a file"""
+    def _load_config_file(self, path: Path, stat: Optional[os.stat_result] = None) -> Config:
+        """Load configuration from a file
+
+        Parsed files are cached by (path, mtime, size), so repeated
+        lookups reparse only when the file actually changed.
+        """
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            if stat is None:
+                stat = path.stat()
+        except OSError as e:
+            logger.warning(f"Failed to load config from {path}: {e}")
+            return Config()
+
+        cache_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed_configs.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            data = _loads(path.read_bytes())
+            if not isinstance(data, dict):
+                raise ValueError(
+                    f"expected a JSON object, got {type(data).__name__}"
+                )
+
             config = Config()
-            
-            if 'language_map' in data and isinstance(data['language_map'], dict):
-                config.language_map = {
-                    k: v for k, v in data['language_map'].items() 
-                    if not k.startswith('#')
-                }
-            
-            if 'filename_map' in data and isinstance(data['filename_map'], dict):
-                config.filename_map = {
-                    k: v for k, v in data['filename_map'].items() 
-                    if not k.startswith('#')
+
+            # One pass over the sections; keys beginning with '#' are
+            # inline comments and dropped. Keys and language values are
+            # interned so per-file map lookups compare by identity.
+            for section in ('language_map', 'filename_map'):
+                value = data.get(section)
+                if isinstance(value, dict):
+                    setattr(config, section, {
+                        sys.intern(k): sys.intern(v) if isinstance(v, str) else v
+                        for k, v in value.items() if not k.startswith('#')
+                    })
+
+            value = data.get('text_extensions')
+            if isinstance(value, list):
+                config.text_extensions = {
+                    ext for ext in value if not ext.startswith('#')
                 }
-            
-            if 'text_extensions' in data and isinstance(data['text_extensions'], list):
-                config.text_extensions = set(
-                    ext for ext in data['text_extensions'] if not ext.startswith('#')
-                )
-            
-            if 'ignore_patterns' in data and isinstance(data['ignore_patterns'], list):
+
+            value = data.get('ignore_patterns')
+            if isinstance(value, list):
                 config.ignore_patterns = [
-                    pattern for pattern in data['ignore_patterns'] 
-                    if not pattern.startswith('#')
+                    pattern for pattern in value if not pattern.startswith('#')
                 ]
-            
-            if 'default_language' in data and isinstance(data['default_language'], str):
-                config.default_language = data['default_language']
-            
+
+            value = data.get('default_language')
+            if isinstance(value, str):
+                config.default_language = value
+
+            self._parsed_configs[cache_key] = config
             return config
-            
-        except (json.JSONDecodeError, OSError) as e:
+
+        except (ValueError, OSError) as e:
             logger.warning(f"Failed to load config from {path}: {e}")
             return Config()
     
     def _load_legacy_ignore_file(self, directory: Path) -> List[str]:
         """Load ignore patterns from legacy context.ignore file"""
         ignore_file = directory / self.LEGACY_IGNORE_FILE
-        patterns = []
-        
-        if ignore_file.exists():
-            try:
-                with open(ignore_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            patterns.append(line)
-                logger.debug(f"Loaded {len(patterns)} patterns from {ignore_file}")
-            except Exception as e:
-                logger.warning(f"Failed to load legacy ignore file {ignore_file}: {e}")
-        
+
+        try:
+            text = ignore_file.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Failed to load legacy ignore file {ignore_file}: {e}")
+            return []
+
+        patterns = [
+            stripped for line in text.splitlines()
+            if (stripped := line.strip()) and not stripped.startswith('#')
+        ]
+        logger.debug(f"Loaded {len(patterns)} patterns from {ignore_file}")
         return patterns
     
     def get_config_for_directory(self, directory: Path) -> Config:
         """Get the merged configuration for a specific directory"""
         directory = directory.resolve()
-        
+
         if directory in self._cached_configs:
             return self._cached_configs[directory]
-        
-        merged_config = Config.get_default_config()
-        global_config = self._load_global_config()
-        merged_config = merged_config.merge(global_config)
-        
-        config_files = []
-        current = directory
-        try:
-            while current != current.parent:
-                config_file = current / self.DEFAULT_CONFIG_NAME
-                if config_file.exists():
-                    config_files.append(config_file)
-                current = current.parent
-        except RuntimeError:
-            logger.warning(f"Path traversal terminated early for {directory}")
-        
-        for config_file in reversed(config_files):
-            dir_config = self._load_config_file(config_file)
-            merged_config = merged_config.merge(dir_config)
-        
+
+        # On-disk cache keyed by the mtimes of every config file that can
+        # affect this directory; a hit skips JSON parsing and merging
+        # across CLI invocations entirely.
+        cache_file = self._disk_cache_file(self._config_sources(directory))
+        cached = self._load_cached_config(cache_file)
+        if cached is not None:
+            self._cached_configs[directory] = cached
+            return cached
+
+        merged_config = self._merged_config_for(directory)
+
         legacy_patterns = self._load_legacy_ignore_file(directory)
         if legacy_patterns:
             legacy_config = Config(ignore_patterns=legacy_patterns)
             merged_config = merged_config.merge(legacy_config)
-        
+
+        self._store_cached_config(cache_file, merged_config)
+
         # Cache the merged config for future use
         self._cached_configs[directory] = merged_config
         return merged_config
-    
+
+    def _config_sources(self, directory: Path) -> List[Tuple[str, int]]:
+        """List the config files that can affect a directory's config
+
+        Returns (path, mtime_ns) pairs for every existing global config,
+        ancestor .ctxport.json, and legacy ignore file, in a stable
+        order. Two lookups with identical sources yield identical merged
+        configs, so the pairs double as the on-disk cache key.
+        """
+        candidates: List[Path] = []
+
+        xdg_config = os.environ.get('XDG_CONFIG_HOME')
+        if xdg_config:
+            candidates.append(Path(xdg_config) / 'ctxport' / self.GLOBAL_CONFIG_NAME)
+        candidates.append(Path.home() / '.config' / 'ctxport' / self.GLOBAL_CONFIG_NAME)
+        candidates.append(Path.home() / f'.{self.GLOBAL_CONFIG_NAME}')
+
+        # The filesystem root's config file is never loaded, matching
+        # the ancestor walk in _merged_config_for.
+        candidates.extend(
+            ancestor / self.DEFAULT_CONFIG_NAME
+            for ancestor in (directory, *directory.parents)
+            if ancestor != ancestor.parent
+        )
+        candidates.append(directory / self.LEGACY_IGNORE_FILE)
+
+        sources: List[Tuple[str, int]] = []
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            sources.append((str(path), stat.st_mtime_ns))
+        return sources
+
+    def _disk_cache_file(self, sources: List[Tuple[str, int]]) -> Path:
+        """Get the on-disk cache path for a set of config sources"""
+        key = hashlib.blake2b(
+            repr((self._DISK_CACHE_VERSION, sources)).encode('utf-8')
+        ).hexdigest()
+        cache_home = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        return Path(cache_home) / 'ctxport' / f'{key}.pkl'
+
+    def _load_cached_config(self, cache_file: Path) -> Optional[Config]:
+        """Load a merged config from the on-disk cache, if present"""
+        try:
+            with open(cache_file, 'rb') as f:
+                fields = pickle.load(f)
+            return Config(**fields)
+        except OSError:
+            return None
+        except Exception as e:
+            logger.debug(f"Discarding unreadable config cache {cache_file}: {e}")
+            return None
+
+    def _store_cached_config(self, cache_file: Path, config: Config) -> None:
+        """Write a merged config to the on-disk cache
+
+        The fields are stored as plain containers (the in-memory config
+        may alias unpicklable frozen defaults) and written via a
+        temporary file plus rename, so concurrent runs only ever see
+        complete entries. Failures are non-fatal: the cache is purely an
+        optimization.
+        """
+        fields = {
+            'language_map': dict(config.language_map),
+            'filename_map': dict(config.filename_map),
+            'text_extensions': set(config.text_extensions),
+            'ignore_patterns': list(config.ignore_patterns),
+            'default_language': config.default_language,
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(fields, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write config cache {cache_file}: {e}")
+
+    def _merged_config_for(self, directory: Path) -> Config:
+        """Get the merged configuration for a directory's ancestor chain
+
+        Each ancestor's merged config is memoized, so sibling directories
+        reuse their common ancestors' merges instead of re-walking to the
+        filesystem root and re-merging on every lookup.
+        """
+        if directory in self._ancestor_configs:
+            return self._ancestor_configs[directory]
+
+        # Collect ancestors that have no memoized config yet
+        chain = []
+        current = directory
+        try:
+            while current not in self._ancestor_configs and current != current.parent:
+                chain.append(current)
+                current = current.parent
+        except RuntimeError:
+            logger.warning(f"Path traversal terminated early for {directory}")
+
+        if current in self._ancestor_configs:
+            config = self._ancestor_configs[current]
+        else:
+            config = Config.get_default_config().merge(self._load_global_config())
+            self._ancestor_configs[current] = config
+
+        # Populate the chain top-down so each directory builds on its parent.
+        # A single stat both checks existence and feeds the parse cache.
+        for ancestor in reversed(chain):
+            config_file = ancestor / self.DEFAULT_CONFIG_NAME
+            try:
+                stat = config_file.stat()
+            except OSError:
+                stat = None
+            if stat is not None:
+                config = config.merge(self._load_config_file(config_file, stat))
+            self._ancestor_configs[ancestor] = config
+
+        return config
+
     def create_example_config(self, path: Path) -> bool:
         """Create an example configuration file
         
@@ -199,4 +349,6 @@ class ConfigManager:
     def clear_cache(self) -> None:
         """Clear the configuration cache"""
         self._cached_configs.clear()
+        self._ancestor_configs.clear()
+        self._parsed_configs.clear()
         self._global_config = None
\ No newline at end of file
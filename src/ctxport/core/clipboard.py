@@ -4,104 +4,187 @@ Clipboard management functionality
 
 import logging
 import platform
+import shutil
 import subprocess
+from functools import lru_cache
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Candidate clipboard tools on Linux, in preference order
+_LINUX_COMMANDS = (
+    ('xclip', '-selection', 'clipboard'),
+    ('xsel', '--clipboard', '--input'),
+    ('wl-copy',),  # Wayland support
+)
+
+# pbcopy needs a UTF-8 locale to accept non-ASCII input
+_CLIPBOARD_ENV = {'LANG': 'en_US.UTF-8'} if platform.system() == 'Darwin' else None
+
+
+@lru_cache(maxsize=None)
+def _candidate_commands() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Discover the installed clipboard commands for this platform.
+
+    The result is cached: neither the platform nor the installed tools
+    change within a process, so discovery runs at most once.
+
+    Returns:
+        The candidate commands in preference order; empty if no
+        clipboard tool is available
+    """
+    system = platform.system().lower()
+
+    if system == 'darwin':
+        return (('pbcopy',),)
+    if system == 'windows':
+        return (('clip',),)
+    if system == 'linux':
+        found = tuple(
+            command for command in _LINUX_COMMANDS if shutil.which(command[0])
+        )
+        if not found:
+            logger.warning("No clipboard tool found on Linux. Install xclip, xsel, or wl-copy.")
+        return found
+
+    logger.warning(f"Unsupported platform: {system}")
+    return ()
+
+
+# The candidate that last completed a copy successfully. An installed
+# tool can still fail at runtime (e.g. xclip on a Wayland session), so
+# what gets cached is the tool that worked, not merely the first found.
+_working_command: Optional[Tuple[str, ...]] = None
+
+
+def _remember_working(command: Tuple[str, ...]) -> None:
+    """Record a command that completed a copy successfully"""
+    global _working_command
+    _working_command = command
+
+
+def _ordered_candidates() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Get the candidate commands with the known-working tool first.
+
+    Returns:
+        The candidate commands, reordered so a previously successful
+        tool is tried before the rest
+    """
+    candidates = _candidate_commands()
+    working = _working_command
+    if working is not None and working in candidates and candidates[0] != working:
+        return (working, *(c for c in candidates if c != working))
+    return candidates
+
+
+def _clipboard_command() -> Optional[Tuple[str, ...]]:
+    """
+    Get the preferred clipboard command for this platform.
+
+    Returns:
+        The command as a tuple of arguments, or None if no clipboard
+        tool is available
+    """
+    candidates = _ordered_candidates()
+    return candidates[0] if candidates else None
+
 
 class ClipboardManager:
     """
     Handles copying text to the system clipboard across different platforms.
     """
-    
+
     def copy_to_clipboard(self, text: str) -> bool:
         """
         Copy text to system clipboard.
-        
+
         Args:
             text: The text to copy to clipboard
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        system = platform.system().lower()
-        
-        try:
-            if system == 'darwin':  # macOS
-                return self._copy_macos(text)
-            elif system == 'linux':
-                return self._copy_linux(text)
-            elif system == 'windows':
-                return self._copy_windows(text)
-            else:
-                logger.warning(f"Unsupported platform: {system}")
-                return False
-        except Exception as e:
-            logger.error(f"Error copying to clipboard: {e}")
-            return False
-    
-    def _copy_macos(self, text: str) -> bool:
-        """
-        Copy text to clipboard on macOS.
-        
-        Args:
-            text: The text to copy
-            
+
         Returns:
             True if successful, False otherwise
         """
-        process = subprocess.Popen(
-            'pbcopy', 
-            env={'LANG': 'en_US.UTF-8'}, 
-            stdin=subprocess.PIPE
-        )
-        process.communicate(text.encode('utf-8'))
-        return process.returncode == 0
-    
-    def _copy_linux(self, text: str) -> bool:
+        return self.copy_bytes(text.encode('utf-8'))
+
+    def copy_bytes(self, data: bytes) -> bool:
         """
-        Copy text to clipboard on Linux.
-        
+        Copy a prepared bytes payload to the system clipboard.
+
+        The whole payload goes to the clipboard tool in one subprocess
+        invocation, so callers that already hold bytes (for example
+        from end_document_bytes) avoid an extra encode and any
+        per-chunk pipe writes.
+
         Args:
-            text: The text to copy
-            
+            data: The bytes to copy to clipboard
+
         Returns:
             True if successful, False otherwise
         """
-        for clipboard_cmd in [
-            ['xclip', '-selection', 'clipboard'],
-            ['xsel', '--clipboard', '--input'],
-            ['wl-copy'],  # Wayland support
-        ]:
+        # subprocess.run with input writes the pipe in one shot; Popen
+        # plus communicate would spin up its select loop for a write
+        # that never reads anything back. A tool that fails at runtime
+        # falls through to the remaining candidates.
+        for command in _ordered_candidates():
             try:
-                process = subprocess.Popen(
-                    clipboard_cmd,
-                    stdin=subprocess.PIPE
+                result = subprocess.run(
+                    list(command),
+                    input=data,
+                    env=_CLIPBOARD_ENV
                 )
-                process.communicate(text.encode('utf-8'))
-                if process.returncode == 0:
-                    return True
-            except FileNotFoundError:
-                # Tool not found, try next one
+            except Exception as e:
+                logger.error(f"Error copying to clipboard with {command[0]}: {e}")
                 continue
-        
-        logger.warning("No clipboard tool found on Linux. Install xclip, xsel, or wl-copy.")
+            if result.returncode == 0:
+                _remember_working(command)
+                return True
+            logger.warning(
+                f"{command[0]} exited with status {result.returncode}; "
+                "trying next clipboard tool"
+            )
         return False
-    
-    def _copy_windows(self, text: str) -> bool:
+
+    def open_stream(self) -> Optional[subprocess.Popen]:
         """
-        Copy text to clipboard on Windows.
-        
+        Open the clipboard tool as a long-lived pipe for incremental writes.
+
+        The returned process's stdin can be used as a binary sink; call
+        close_stream once all output has been written.
+
+        Returns:
+            The clipboard process, or None if no clipboard tool is available
+        """
+        command = _clipboard_command()
+        if command is None:
+            return None
+
+        try:
+            return subprocess.Popen(
+                list(command),
+                stdin=subprocess.PIPE,
+                bufsize=1 << 20,
+                env=_CLIPBOARD_ENV
+            )
+        except Exception as e:
+            logger.error(f"Error opening clipboard pipe: {e}")
+            return None
+
+    def close_stream(self, process: subprocess.Popen) -> bool:
+        """
+        Finish a streaming clipboard write started with open_stream.
+
         Args:
-            text: The text to copy
-            
+            process: The clipboard process returned by open_stream
+
         Returns:
-            True if successful, False otherwise
+            True if the clipboard tool exited cleanly, False otherwise
         """
-        process = subprocess.Popen(
-            ['clip'],
-            stdin=subprocess.PIPE,
-            shell=True
-        )
-        process.communicate(text.encode('utf-8'))
-        return process.returncode == 0
\ No newline at end of file
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            return process.wait() == 0
+        except Exception as e:
+            logger.error(f"Error finishing clipboard write: {e}")
+            return False
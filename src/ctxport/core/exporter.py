@@ -3,37 +3,77 @@ Main exporter functionality
 """
 
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
 
 from ctxport.config import Config, ConfigManager
 from ctxport.core.file_filter import FileFilter
 from ctxport.core.file_handler import FileHandler
 from ctxport.formatters import OutputFormatter, MarkdownFormatter
-from ctxport.utils.path_utils import find_files
+from ctxport.utils.path_utils import walk_entries
 
 logger = logging.getLogger(__name__)
 
 
+def _bounded_map(
+    executor: ThreadPoolExecutor,
+    fn: Callable[..., Any],
+    *iterables: Iterable[Any],
+    window: int
+) -> Iterator[Any]:
+    """
+    Map fn over the iterables with a bounded number of tasks in flight.
+
+    executor.map submits every task up front, so on a large tree the
+    completed-but-unconsumed results can hold the whole output in
+    memory ahead of the writer. This keeps at most `window` submissions
+    outstanding while still yielding results in input order, which is
+    enough to keep every worker fed.
+
+    Args:
+        executor: The executor to submit tasks to
+        fn: The function to apply
+        iterables: Argument iterables, consumed in lockstep like map
+        window: The maximum number of in-flight tasks
+
+    Yields:
+        The results of fn in input order
+    """
+    pending = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
 class CodeExporter:
     """
     Main class for code context export functionality
     """
     
     def __init__(
-        self, 
+        self,
         config_manager: ConfigManager,
-        formatter: Optional[OutputFormatter] = None
+        formatter: Optional[OutputFormatter] = None,
+        max_workers: Optional[int] = None
     ):
         """
         Initialize the code exporter.
-        
+
         Args:
             config_manager: The configuration manager to use
             formatter: The output formatter to use (default: MarkdownFormatter)
+            max_workers: Number of parallel file-read workers
+                (default: based on CPU count)
         """
         self.config_manager = config_manager
         self.formatter = formatter or MarkdownFormatter()
+        self.max_workers = max_workers
         self.directory: Optional[Path] = None
         self.config: Optional[Config] = None
         self.file_handler: Optional[FileHandler] = None
@@ -52,57 +92,120 @@ class CodeExporter:
         self.file_filter = FileFilter(self.config, self.directory)
         logger.debug(f"Set working directory to: {self.directory}")
     
-    def export_directory(self, verbose: bool = False) -> Tuple[str, int]:
+    def export_directory(
+        self,
+        verbose: bool = False,
+        sink: Optional[BinaryIO] = None
+    ) -> Tuple[str, int]:
         """
         Export all files in the directory to the configured format.
-        
+
         Args:
             verbose: Whether to print verbose output
-            
+            sink: An optional binary stream; when given, output is written
+                to it incrementally instead of accumulated in memory
+
         Returns:
-            A tuple of (formatted_output, file_count)
+            A tuple of (formatted_output, file_count); formatted_output is
+            an empty string when a sink is used
         """
         if not self.directory or not self.config:
             raise RuntimeError("Working directory not set. Call set_directory() first.")
-            
-        self.formatter.begin_document(self.directory.name)
+        if self.max_workers is not None and self.max_workers < 1:
+            # Raised here, before the catch-all below would turn it into
+            # an error section and a spurious success exit
+            raise ValueError(f"max_workers must be positive, got {self.max_workers}")
+
+        self.formatter.begin_document(self.directory.name, sink)
         file_count = 0
         
         try:
-            for file_path in sorted(find_files(self.directory)):
-                if not self.file_filter.should_include_file(file_path):
+            # Files whose names settle inclusion are read outright; files
+            # the filter can't decide from the name are classified by the
+            # worker from the bytes it reads anyway, so no file is opened
+            # twice for a separate content sniff.
+            files: List[Path] = []
+            probes: List[bool] = []
+            walk = walk_entries(self.directory, self.file_filter.should_ignore_dir)
+            for entry in walk:
+                included = self.file_filter.classify_entry(entry)
+                if included is False:
                     continue
-                    
-                if verbose:
-                    rel_path = self.file_handler.get_relative_path(file_path)
-                    logger.info(f"Processing: {rel_path}")
-                
-                self._process_file(file_path)
-                file_count += 1
+                files.append(Path(entry.path))
+                probes.append(included is None)
+
+            # Reads are I/O-bound and release the GIL, so a thread pool
+            # overlaps syscall latency; executor.map preserves input order
+            # so the formatter still sees files in walk order.
+            max_workers = self.max_workers or min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                window = max_workers * 2
+                if sink is not None and hasattr(self.formatter, 'render_file_bytes'):
+                    # Streaming: workers read and render whole sections;
+                    # the writer just emits the blobs in input order.
+                    for file_path, section in zip(
+                        files,
+                        _bounded_map(
+                            executor, self._render_file, files, probes,
+                            window=window
+                        )
+                    ):
+                        if section is None:
+                            continue
+                        if verbose:
+                            logger.info(
+                                f"Processing: {self.file_handler.get_relative_path(file_path)}"
+                            )
+                        self.formatter.add_rendered(section)
+                        file_count += 1
+                else:
+                    results = _bounded_map(
+                        executor, self.file_handler.read_and_classify,
+                        files, probes, window=window
+                    )
+                    for file_path, (content, language) in zip(files, results):
+                        if content is None:
+                            continue
+                        relative_path = self.file_handler.get_relative_path(file_path)
+
+                        if verbose:
+                            logger.info(f"Processing: {relative_path}")
+
+                        self.formatter.add_file(
+                            path=str(relative_path),
+                            content=self.file_handler.decode_content(content),
+                            language=language
+                        )
+                        file_count += 1
         except Exception as e:
             logger.error(f"Error during export: {e}")
             self.formatter.add_error(f"Error during export: {e}")
-            
+
         output_content = self.formatter.end_document()
-        
+
         return output_content, file_count
-    
-    def _process_file(self, file_path: Path) -> None:
+
+    def _render_file(self, file_path: Path, probe: bool) -> Optional[bytes]:
         """
-        Process a single file and add its content to the output.
-        
+        Read a file and render its complete output section.
+
+        Runs in worker threads so the read and the formatting work both
+        happen off the writer loop.
+
         Args:
-            file_path: The file path to process
+            file_path: The file path to render
+            probe: Whether the file still needs content classification
+
+        Returns:
+            The rendered section as bytes, or None if probing rejected
+            the file as binary
         """
+        content, language = self.file_handler.read_and_classify(file_path, probe)
+        if content is None:
+            return None
         relative_path = self.file_handler.get_relative_path(file_path)
-        content, language = self.file_handler.read_file(file_path)
-        
-        self.formatter.add_file(
-            path=str(relative_path),
-            content=content,
-            language=language
-        )
-        
+        return self.formatter.render_file_bytes(str(relative_path), content, language)
+
     def set_formatter(self, formatter: OutputFormatter) -> None:
         """
         Set a different output formatter.
@@ -4,13 +4,26 @@ File filtering functionality
 
 import fnmatch
 import logging
+import os
+import re
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
 
 from ctxport.config import Config
 from ctxport.utils.mime_utils import is_text_file
 
 logger = logging.getLogger(__name__)
 
+# Suffixes that are binary beyond doubt; files carrying one are rejected
+# from the name alone, with no content probe.
+_BINARY_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.pdf',
+    '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.so', '.dylib',
+    '.dll', '.exe', '.o', '.a', '.class', '.jar', '.war', '.whl',
+    '.woff', '.woff2', '.ttf', '.eot', '.otf', '.mp3', '.mp4', '.avi',
+    '.mov', '.sqlite', '.db',
+})
+
 
 class FileFilter:
     """
@@ -23,11 +36,75 @@ class FileFilter:
         
         Args:
             config: The configuration containing ignore patterns and text extensions
-            base_directory: The base directory for relative path calculation
+            base_directory: The base directory for relative path
+                calculation; must already be resolved
         """
         self.config = config
-        self.base_directory = base_directory.resolve()
+        self.base_directory = base_directory
+        self._base_prefix = str(self.base_directory) + os.sep
         self._always_ignore_files = {'.ctxport.json', 'ctxport.json', 'context.ignore'}
+        self._text_suffixes = frozenset(config.text_extensions)
+        # Exact names (no wildcards, no path separators) get O(1) membership
+        # checks before any pattern matching; this covers the hot prunes
+        # like .git, node_modules, and __pycache__.
+        self._prune_names = frozenset(
+            pattern.rstrip('/') for pattern in config.ignore_patterns
+            if '/' not in pattern.rstrip('/')
+            and not any(ch in pattern for ch in '*?[')
+        )
+        self._dir_re, self._path_re, self._name_re = self._compile_patterns(
+            config.ignore_patterns
+        )
+        self._matches_rel_str = self._build_rel_matcher()
+
+    @staticmethod
+    def _compile_patterns(
+        patterns: List[str]
+    ) -> Tuple[Optional[re.Pattern], Optional[re.Pattern], Optional[re.Pattern]]:
+        """
+        Precompile ignore patterns into combined regular expressions.
+
+        Patterns are partitioned into directory patterns (trailing '/'),
+        path patterns (containing '/') matched against the full relative
+        path, and basename patterns matched against individual path parts.
+        Each group is compiled once into a single alternation so matching
+        is one pass instead of a per-pattern fnmatch loop. Wildcard-free
+        names are left out entirely — the exact-name set handles those —
+        keeping the alternations small.
+
+        Args:
+            patterns: The ignore patterns from the configuration
+
+        Returns:
+            A tuple of (dir_re, path_re, name_re), each None if its
+            group is empty
+        """
+        dir_patterns: List[str] = []
+        path_patterns: List[str] = []
+        name_patterns: List[str] = []
+
+        for pattern in patterns:
+            if pattern.endswith('/'):
+                pattern = pattern[:-1]
+                if '/' not in pattern and not any(ch in pattern for ch in '*?['):
+                    continue  # covered by the exact-name set
+                dir_patterns.append(pattern)
+            elif '/' in pattern:
+                path_patterns.append(pattern)
+            elif any(ch in pattern for ch in '*?['):
+                name_patterns.append(pattern)
+            # else: wildcard-free name, covered by the exact-name set
+
+        def compile_group(group: List[str]) -> Optional[re.Pattern]:
+            if not group:
+                return None
+            return re.compile('|'.join(fnmatch.translate(p) for p in group))
+
+        return (
+            compile_group(dir_patterns),
+            compile_group(path_patterns),
+            compile_group(name_patterns),
+        )
     
     def should_include_file(self, file_path: Path) -> bool:
         """
@@ -42,13 +119,105 @@ class FileFilter:
         # Skip if it should be ignored
         if self.should_ignore(file_path):
             return False
-            
+
         # Skip if it's not a text file
         if not self.is_text_file(file_path):
             return False
-            
+
         return True
-    
+
+    def should_include_entry(self, entry: os.DirEntry) -> bool:
+        """
+        Determines whether a directory entry should be included in the export.
+
+        Unlike should_include_file, this trusts the entry type cached from
+        the directory scan, so no extra stat syscall is made per file, and
+        it works on the entry's path string throughout — no Path objects
+        are built for entries that end up excluded.
+
+        Args:
+            entry: A DirEntry known to be a regular file
+
+        Returns:
+            True if the file should be included, False otherwise
+        """
+        classified = self.classify_entry(entry)
+        if classified is not None:
+            return classified
+
+        # Sniff the file content as a fallback
+        try:
+            return is_text_file(entry.path)
+        except Exception as e:
+            logger.warning(f"Error checking if {entry.path} is text: {e}")
+            return False
+
+    def classify_entry(self, entry: os.DirEntry) -> Optional[bool]:
+        """
+        Classify a directory entry without touching the file's content.
+
+        This is the I/O-free half of should_include_entry: callers that
+        read included files anyway (the exporter) can resolve the
+        undecided case from the bytes they are about to read, so each
+        file is opened exactly once.
+
+        Args:
+            entry: A DirEntry known to be a regular file
+
+        Returns:
+            True to include, False to exclude, or None if the name alone
+            is not enough and the content must be sniffed
+        """
+        name = entry.name
+
+        # Always ignore our configuration files
+        if name in self._always_ignore_files:
+            return False
+
+        if self._matches_rel_str(self._relative_str(entry.path)):
+            return False
+
+        return self._known_text_name(name)
+
+    def _relative_str(self, path_str: str) -> str:
+        """
+        Get the path string relative to the base directory.
+
+        The base is fixed and resolved, so a prefix slice replaces the
+        Path.relative_to machinery.
+
+        Args:
+            path_str: An absolute path string under the base directory
+
+        Returns:
+            The relative path string, or the input unchanged if it is
+            not under the base directory
+        """
+        if path_str.startswith(self._base_prefix):
+            return path_str[len(self._base_prefix):]
+        return path_str
+
+    def should_ignore_dir(self, dir_name: str) -> bool:
+        """
+        Check if a directory should be pruned from traversal entirely.
+
+        Directory patterns (trailing '/') and bare-name patterns prune the
+        whole subtree, so ignored directories are never descended into.
+
+        Args:
+            dir_name: The directory name (not the full path)
+
+        Returns:
+            True if the directory subtree should be skipped, False otherwise
+        """
+        if dir_name in self._prune_names:
+            return True
+        if self._dir_re is not None and self._dir_re.match(dir_name):
+            return True
+        if self._name_re is not None and self._name_re.match(dir_name):
+            return True
+        return False
+
     def should_ignore(self, file_path: Path) -> bool:
         """
         Check if a file should be ignored based on ignore patterns.
@@ -66,57 +235,136 @@ class FileFilter:
         # Always ignore our configuration files
         if file_path.name in self._always_ignore_files:
             return True
-            
+
+        return self._matches_ignore_patterns(file_path)
+
+    def _matches_ignore_patterns(self, file_path: Path) -> bool:
+        """
+        Check a file path against the compiled ignore patterns.
+
+        Args:
+            file_path: The file path to check
+
+        Returns:
+            True if the path matches an ignore pattern, False otherwise
+        """
         try:
-            # Calculate the relative path from the base directory
             relative_path = file_path.relative_to(self.base_directory)
-            
-            # Check each ignore pattern
-            for pattern in self.config.ignore_patterns:
-                # Handle directory patterns that end with '/'
-                if pattern.endswith('/'):
-                    dir_pattern = pattern[:-1]
-                    if any(part == dir_pattern for part in relative_path.parts):
-                        logger.debug(f"Ignoring {relative_path} (matched directory pattern: {pattern})")
-                        return True
-                
-                # Check if pattern matches the full relative path
-                if fnmatch.fnmatch(str(relative_path), pattern):
-                    logger.debug(f"Ignoring {relative_path} (matched pattern: {pattern})")
-                    return True
-                    
-                # Check if pattern matches any part of the path
-                for part in relative_path.parts:
-                    if fnmatch.fnmatch(part, pattern):
-                        logger.debug(f"Ignoring {relative_path} (matched pattern part: {pattern})")
-                        return True
         except ValueError:
             # If we can't calculate relative path, ignore the file
             return True
-            
-        return False
-    
+
+        return self._matches_rel_str(str(relative_path))
+
+    def _build_rel_matcher(self) -> Callable[[str], bool]:
+        """
+        Build a matcher function specialized for the active pattern set.
+
+        The pattern structures become closure locals and checks for
+        empty groups are elided when the closure is built, so the
+        per-entry call does no attribute lookups and no dead-branch
+        tests. This gets the effect of generating source for the
+        concrete config without exec'd code.
+
+        Returns:
+            A function taking a relative path string and returning True
+            if it matches an ignore pattern
+        """
+        prune_names = self._prune_names or None
+        dir_re = self._dir_re
+        path_re = self._path_re
+        name_re = self._name_re
+        sep = os.sep
+
+        part_checks = []
+        if prune_names is not None:
+            part_checks.append(prune_names.__contains__)
+        if dir_re is not None:
+            part_checks.append(dir_re.match)
+        if name_re is not None:
+            part_checks.append(name_re.match)
+
+        if path_re is None and not part_checks:
+            return lambda rel_str: False
+
+        if not part_checks:
+            return lambda rel_str: path_re.match(rel_str) is not None
+
+        def matches(rel_str: str) -> bool:
+            # Check the full relative path against path patterns
+            if path_re is not None and path_re.match(rel_str):
+                logger.debug(f"Ignoring {rel_str} (matched path pattern)")
+                return True
+
+            # Check each path part against the active name-level checks
+            for part in rel_str.split(sep):
+                for check in part_checks:
+                    if check(part):
+                        logger.debug(f"Ignoring {rel_str} (matched ignore pattern)")
+                        return True
+            return False
+
+        return matches
+
     def is_text_file(self, file_path: Path) -> bool:
         """
         Determine if a file is a text file that should be included.
-        
+
         Args:
             file_path: The file path to check
-            
+
+        Returns:
+            True if the file is a text file, False otherwise
+        """
+        return self._is_text_name(file_path.name, file_path)
+
+    def _is_text_name(self, name: str, path: Union[str, Path]) -> bool:
+        """
+        Determine text-ness from a file name, sniffing content as a fallback.
+
+        Args:
+            name: The file's basename
+            path: The full path, used only if content sniffing is needed
+
         Returns:
             True if the file is a text file, False otherwise
         """
+        known = self._known_text_name(name)
+        if known is not None:
+            return known
+
+        # Sniff the file content as a fallback
+        try:
+            return is_text_file(path)
+        except Exception as e:
+            logger.warning(f"Error checking if {path} is text: {e}")
+            return False
+
+    def _known_text_name(self, name: str) -> Optional[bool]:
+        """
+        Determine text-ness from a file name alone.
+
+        Args:
+            name: The file's basename
+
+        Returns:
+            True if the name marks a known text file, False if it marks
+            a known binary one, or None if the name is inconclusive and
+            the content must be sniffed
+        """
+        lower = name.lower()
+
         # Check if the extension is in our configured text extensions
-        if file_path.suffix.lower() in self.config.text_extensions:
-            return True
-            
+        dot = lower.rfind('.')
+        if dot > 0:
+            ext = lower[dot:]
+            if ext in self._text_suffixes:
+                return True
+            if ext in _BINARY_SUFFIXES:
+                return False
+
         # Check if the filename is in our configured filename map
-        if file_path.name.lower() in self.config.filename_map:
+        if lower in self.config.filename_map:
             return True
-            
-        # Use MIME type detection as a fallback
-        try:
-            return is_text_file(file_path)
-        except Exception as e:
-            logger.warning(f"Error checking if {file_path} is text: {e}")
-            return False
\ No newline at end of file
+
+        return None
\ No newline at end of file
@@ -3,13 +3,19 @@ File handling functionality
 """
 
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from ctxport.config import Config
+from ctxport.utils.mime_utils import _PROBE_SIZE, is_text_bytes
 
 logger = logging.getLogger(__name__)
 
+# posix_fadvise is Linux/POSIX only
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
 
 class FileHandler:
     """
@@ -22,11 +28,22 @@ class FileHandler:
         
         Args:
             config: The configuration containing language mappings
-            base_directory: The base directory for relative path calculation
+            base_directory: The base directory for relative path
+                calculation; must already be resolved
         """
         self.config = config
-        self.base_directory = base_directory.resolve()
-    
+        self.base_directory = base_directory
+        self._base_prefix = str(self.base_directory) + os.sep
+        # Both language maps flattened into one dict with prefixed keys,
+        # so detection is at most two hash probes. Suffixes that miss are
+        # memoized into the same dict; a repo rarely has more than a few
+        # dozen distinct suffixes, so this stays tiny.
+        self._language_lookup: Dict[str, Optional[str]] = {}
+        for name, language in config.filename_map.items():
+            self._language_lookup['name:' + name.lower()] = language
+        for ext, language in config.language_map.items():
+            self._language_lookup['ext:' + ext.lower()] = language
+
     def get_relative_path(self, file_path: Path) -> Path:
         """
         Get the relative path from the base directory.
@@ -37,11 +54,13 @@ class FileHandler:
         Returns:
             The path relative to the base directory
         """
-        try:
-            return file_path.relative_to(self.base_directory)
-        except ValueError:
-            # If we can't calculate relative path, return the file name
-            return Path(file_path.name)
+        # The base is fixed and resolved, so a prefix slice replaces the
+        # parent-walking Path.relative_to machinery.
+        path_str = str(file_path)
+        if path_str.startswith(self._base_prefix):
+            return Path(path_str[len(self._base_prefix):])
+        # If the path isn't under the base directory, return the file name
+        return Path(file_path.name)
     
     def read_file(self, file_path: Path) -> Tuple[str, Optional[str]]:
         """
@@ -53,25 +72,118 @@ class FileHandler:
         Returns:
             A tuple of (file_content, language)
         """
-        language = self.get_language(file_path)
-        
+        content, language = self.read_file_bytes(file_path)
+
+        return self.decode_content(content), language
+
+    @staticmethod
+    def decode_content(content: bytes) -> str:
+        """
+        Decode file bytes as UTF-8, falling back to a lenient encoding.
+
+        Args:
+            content: The raw file content
+
+        Returns:
+            The decoded content string
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            return content, language
+            return content.decode('utf-8')
         except UnicodeDecodeError:
-            # Try with a different encoding if UTF-8 fails
+            # Fall back to a lenient single-byte encoding
+            return content.decode('latin-1')
+
+    def read_file_bytes(self, file_path: Path) -> Tuple[bytes, Optional[str]]:
+        """
+        Read a file's raw bytes and determine its language.
+
+        Used on the streaming path, where the content bytes are passed
+        through to the output sink without a decode/encode round-trip.
+
+        Args:
+            file_path: The file path to read
+
+        Returns:
+            A tuple of (file_content_bytes, language)
+        """
+        content, language = self.read_and_classify(file_path, probe=False)
+        return content, language
+
+    def read_and_classify(
+        self, file_path: Path, probe: bool = True
+    ) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        Read a file in a single open, optionally sniffing it for binary
+        content first.
+
+        With probe set, the leading bytes are checked before the rest of
+        the file is read: a binary file returns (None, language) after
+        one short read, and a text file is never opened a second time
+        for a separate classification pass.
+
+        Args:
+            file_path: The file path to read
+            probe: Whether to classify the leading bytes and reject
+                binary files
+
+        Returns:
+            A tuple of (file_content_bytes, language); content is None
+            if probing rejected the file as binary or unreadable
+        """
+        language = self.get_language(file_path)
+
+        # Read through a raw descriptor sized from one fstat; a buffered
+        # reader would add lseek/readahead syscalls per file.
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+        except OSError as e:
+            if probe:
+                logger.debug(f"Error probing {file_path}: {e}")
+                return None, language
+            logger.error(f"Error reading file {file_path}: {e}")
+            return f"# Error reading file: {str(e)}".encode('utf-8'), language
+
+        if _HAS_FADVISE:
+            # Tell the kernel this is one front-to-back read so it can
+            # prefetch ahead of us; purely advisory, so errors are
+            # ignored. Pays off on cold-cache reads of larger files.
             try:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-                return content, language
-            except Exception as e:
-                logger.error(f"Error reading file {file_path}: {e}")
-                return f"# Error reading file: {str(e)}", language
-        except Exception as e:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+
+        try:
+            size = os.fstat(fd).st_size
+            first = min(size, _PROBE_SIZE) if probe else size
+            content = os.read(fd, first) if size else b''
+            if probe and not is_text_bytes(content):
+                return None, language
+            # A single read can come up short on some filesystems
+            while len(content) < size:
+                chunk = os.read(fd, size - len(content))
+                if not chunk:
+                    break
+                content += chunk
+            # Downstream consumers splice these bytes into the UTF-8
+            # document verbatim, so non-UTF-8 text (e.g. latin-1) must
+            # be transcoded here. ASCII content skips the check via one
+            # C-level scan.
+            if not content.isascii():
+                try:
+                    content.decode('utf-8')
+                except UnicodeDecodeError:
+                    content = self.decode_content(content).encode('utf-8')
+            return content, language
+        except OSError as e:
+            if probe:
+                logger.debug(f"Error probing {file_path}: {e}")
+                return None, language
             logger.error(f"Error reading file {file_path}: {e}")
-            return f"# Error reading file: {str(e)}", language
-    
+            return f"# Error reading file: {str(e)}".encode('utf-8'), language
+        finally:
+            os.close(fd)
+
     def get_language(self, file_path: Path) -> Optional[str]:
         """
         Determine the language for syntax highlighting based on filename or extension.
@@ -82,11 +194,27 @@ class FileHandler:
         Returns:
             The language identifier or None if not determined
         """
+        # One lowercase of the basename serves both lookups; Path.suffix
+        # would redo the rfind-and-slice on every call.
+        lower = file_path.name.lower()
+        lookup = self._language_lookup
+
         # First check filename mapping (case-insensitive)
-        filename = file_path.name.lower()
-        if filename in self.config.filename_map:
-            return self.config.filename_map[filename]
-        
-        # Then check extension mapping
-        ext = file_path.suffix.lower() 
-        return self.config.language_map.get(ext, self.config.default_language)
\ No newline at end of file
+        language = lookup.get('name:' + lower)
+        if language is not None:
+            return language
+
+        # Then check extension mapping, with misses memoized
+        dot = lower.rfind('.')
+        key = 'ext:' + (lower[dot:] if dot > 0 else '')
+        try:
+            return lookup[key]
+        except KeyError:
+            language = self.config.default_language
+            # Intern the memoized key and value: the key is a fresh
+            # concatenation per miss, and an interned language makes
+            # downstream equality checks a pointer comparison.
+            if language is not None:
+                language = sys.intern(language)
+            lookup[sys.intern(key)] = language
+            return language
\ No newline at end of file
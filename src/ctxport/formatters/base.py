@@ -3,23 +3,26 @@ Base formatter interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 class OutputFormatter(ABC):
     """
     Abstract base class for output formatters.
-    
+
     Formatters convert the exported code into a specific output format.
+    When a sink is provided, output is streamed to it as it is produced
+    instead of being accumulated in memory.
     """
-    
+
     @abstractmethod
-    def begin_document(self, project_name: str) -> None:
+    def begin_document(self, project_name: str, sink: Optional[BinaryIO] = None) -> None:
         """
         Begin a new document.
-        
+
         Args:
             project_name: The name of the project being exported
+            sink: An optional binary stream to write output to incrementally
         """
         pass
     
@@ -35,6 +38,21 @@ class OutputFormatter(ABC):
         """
         pass
     
+    def add_file_bytes(self, path: str, content: bytes, language: Optional[str] = None) -> None:
+        """
+        Add a file to the document from raw bytes.
+
+        Formatters with a binary sink can override this to splice the
+        bytes through without a decode/encode round-trip. The default
+        decodes and delegates to add_file.
+
+        Args:
+            path: The relative path of the file
+            content: The raw content of the file
+            language: The language identifier for syntax highlighting (optional)
+        """
+        self.add_file(path, content.decode('utf-8', errors='replace'), language)
+
     @abstractmethod
     def add_error(self, message: str) -> None:
         """
@@ -49,8 +67,23 @@ class OutputFormatter(ABC):
     def end_document(self) -> str:
         """
         Finalize and return the document.
-        
+
+        Returns:
+            The formatted document as a string, or an empty string when
+            output was streamed to a sink
+        """
+        pass
+
+    def end_document_bytes(self) -> bytes:
+        """
+        Finalize and return the document as UTF-8 bytes.
+
+        Formatters that accumulate bytes internally can override this to
+        hand the buffer over without a decode/encode round-trip. The
+        default encodes the end_document string.
+
         Returns:
-            The formatted document as a string
+            The formatted document as bytes, or empty bytes when output
+            was streamed to a sink
         """
-        pass
\ No newline at end of file
+        return self.end_document().encode('utf-8')
\ No newline at end of file
@@ -2,7 +2,7 @@
 Markdown formatter
 """
 
-from typing import List, Optional
+from typing import BinaryIO, Optional
 
 from ctxport.formatters.base import OutputFormatter
 
@@ -10,64 +10,140 @@ from ctxport.formatters.base import OutputFormatter
 class MarkdownFormatter(OutputFormatter):
     """
     Formats code context as markdown.
-    
+
     The output includes a header with the project name,
     and each file in a section with its relative path in a code block
     with appropriate syntax highlighting.
+
+    With a sink, each section is written out as soon as it is produced;
+    without one, the document accumulates in a single bytearray - one
+    growing buffer instead of a list of strings plus a join-time copy -
+    and is returned by end_document.
     """
-    
+
+    # Preformatted byte templates shared by both modes; %-formatting on
+    # bytes happens in C, avoiding an f-string plus encode per section.
+    _TITLE_TPL = b"# Code Context Export: %s\n\n"
+    _HEADER_TPL = b"## %s\n\n```%s\n"
+    _FOOTER = b"\n```\n\n"
+    _ERROR_TPL = b"### Error\n\n```\n%s\n```\n\n"
+
     def __init__(self):
-        self.lines: List[str] = []
-    
-    def begin_document(self, project_name: str) -> None:
+        self.buf = bytearray()
+        self.sink: Optional[BinaryIO] = None
+
+    def begin_document(self, project_name: str, sink: Optional[BinaryIO] = None) -> None:
         """
         Begin a new markdown document.
-        
+
         Args:
             project_name: The name of the project being exported
+            sink: An optional binary stream to write output to incrementally
         """
-        self.lines = [
-            f"# Code Context Export: {project_name}",
-            "",
-        ]
-    
+        self.sink = sink
+        self.buf = bytearray()
+        out = self.sink.write if self.sink is not None else self.buf.extend
+        out(self._TITLE_TPL % project_name.encode('utf-8'))
+
     def add_file(self, path: str, content: str, language: Optional[str] = None) -> None:
         """
         Add a file to the markdown document.
-        
+
         Args:
             path: The relative path of the file
             content: The content of the file
             language: The language identifier for syntax highlighting (optional)
         """
-        self.lines.append(f"## {path}")
-        self.lines.append("")
-        
+        self.add_file_bytes(path, content.encode('utf-8'), language)
+
+    def add_file_bytes(self, path: str, content: bytes, language: Optional[str] = None) -> None:
+        """
+        Add a file to the markdown document from raw bytes.
+
+        The content bytes pass straight through to the sink or buffer,
+        avoiding a decode/encode round-trip per file.
+
+        Args:
+            path: The relative path of the file
+            content: The raw content of the file
+            language: The language identifier for syntax highlighting (optional)
+        """
+        lang_spec = language if language else ""
+        out = self.sink.write if self.sink is not None else self.buf.extend
+        out(self._HEADER_TPL % (path.encode('utf-8'), lang_spec.encode('utf-8')))
+        out(content)
+        out(self._FOOTER)
+
+    def render_file_bytes(self, path: str, content: bytes, language: Optional[str] = None) -> bytes:
+        """
+        Render a complete file section as bytes.
+
+        Safe to call from worker threads; the result is emitted in order
+        via add_rendered.
+
+        Args:
+            path: The relative path of the file
+            content: The raw content of the file
+            language: The language identifier for syntax highlighting (optional)
+
+        Returns:
+            The rendered markdown section as bytes
+        """
         lang_spec = language if language else ""
-        self.lines.append(f"```{lang_spec}")
-        self.lines.append(content)
-        self.lines.append("```")
-        self.lines.append("")
-    
+        return b"".join((
+            self._HEADER_TPL % (path.encode('utf-8'), lang_spec.encode('utf-8')),
+            content,
+            self._FOOTER,
+        ))
+
+    def add_rendered(self, section: bytes) -> None:
+        """
+        Add a section previously produced by render_file_bytes.
+
+        Args:
+            section: The rendered section bytes
+        """
+        if self.sink is not None:
+            self.sink.write(section)
+        else:
+            self.buf += section
+
     def add_error(self, message: str) -> None:
         """
         Add an error message to the markdown document.
-        
+
         Args:
             message: The error message
         """
-        self.lines.append(f"### Error")
-        self.lines.append("")
-        self.lines.append(f"```")
-        self.lines.append(message)
-        self.lines.append("```")
-        self.lines.append("")
-    
+        out = self.sink.write if self.sink is not None else self.buf.extend
+        out(self._ERROR_TPL % message.encode('utf-8'))
+
     def end_document(self) -> str:
         """
         Finalize and return the markdown document.
-        
+
+        Returns:
+            The formatted markdown document as a string, or an empty
+            string when output was streamed to a sink
+        """
+        if self.sink is not None:
+            self.sink.flush()
+            return ""
+        return self.buf.decode('utf-8', errors='replace')
+
+    def end_document_bytes(self) -> bytes:
+        """
+        Finalize and return the markdown document as UTF-8 bytes.
+
+        Hands over the accumulated buffer with no decode/encode
+        round-trip; preferred by callers that write bytes onward (files,
+        clipboard pipes).
+
         Returns:
-            The formatted markdown document as a string
+            The formatted markdown document as bytes, or empty bytes
+            when output was streamed to a sink
         """
-        return "\n".join(self.lines)
\ No newline at end of file
+        if self.sink is not None:
+            self.sink.flush()
+            return b""
+        return bytes(self.buf)
\ No newline at end of file
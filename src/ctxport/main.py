@@ -6,19 +6,75 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from ctxport.config import ConfigManager
-from ctxport.core import CodeExporter, ClipboardManager
-from ctxport.utils.path_utils import normalize_path
+if TYPE_CHECKING:
+    from ctxport.config import ConfigManager
+    from ctxport.core import CodeExporter, ClipboardManager
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format='%(levelname)s: %(message)s'
-)
 logger = logging.getLogger("ctxport")
 
 
+def _recover_clipboard_failure(
+    exporter: 'CodeExporter',
+    clipboard: 'ClipboardManager',
+    verbose: bool
+) -> int:
+    """
+    Recover from a failed streaming clipboard hand-off.
+
+    The streamed output is gone with the failed process, so the export
+    is re-run in memory and handed to copy_to_clipboard, which retries
+    the remaining clipboard tools and remembers the one that works. If
+    no tool takes it, the output is printed to stdout so the export is
+    never silently discarded.
+
+    Args:
+        exporter: The exporter, already pointed at the target directory
+        clipboard: The clipboard manager to retry the copy with
+        verbose: Whether to print verbose output
+
+    Returns:
+        The CLI exit code: 0 if a retry copied successfully, 1 otherwise
+    """
+    try:
+        output_content, file_count = exporter.export_directory(verbose)
+    except Exception as e:
+        logger.error(f"Export failed: {e}")
+        return 1
+    if clipboard.copy_to_clipboard(output_content):
+        print(f"Successfully copied {file_count} files to clipboard")
+        return 0
+    print("Error: Could not copy to clipboard. Printing to stdout instead:")
+    print("-" * 40)
+    print(output_content)
+    return 1
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse an argparse value that must be a strictly positive integer.
+
+    Args:
+        value: The raw argument string
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer, got {value}"
+        )
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """
     Create the command-line argument parser.
@@ -47,6 +103,13 @@ def create_parser() -> argparse.ArgumentParser:
         action='store_true',
         help='Verbose output'
     )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=_positive_int,
+        metavar='N',
+        help='Number of parallel file-read workers (default: based on CPU count)'
+    )
     
     parser.add_argument(
         '--debug',
@@ -72,7 +135,7 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def handle_config_initialization(args: argparse.Namespace, config_manager: ConfigManager) -> bool:
+def handle_config_initialization(args: argparse.Namespace, config_manager: 'ConfigManager') -> bool:
     """
     Handle configuration initialization commands.
     
@@ -106,26 +169,6 @@ def handle_config_initialization(args: argparse.Namespace, config_manager: Confi
     return False
 
 
-def write_to_file(file_path: Path, content: str) -> bool:
-    """
-    Write content to a file.
-    
-    Args:
-        file_path: The path to write to
-        content: The content to write
-        
-    Returns:
-        True on success, False on failure
-    """
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
-    except Exception as e:
-        logger.error(f"Error writing to file: {e}")
-        return False
-
-
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the Code Context Exporter.
@@ -136,14 +179,40 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    arg_list = sys.argv[1:] if argv is None else argv
+
+    # Fast path: the config-init commands take no other arguments, so an
+    # exact argv match can skip parser construction (and the help
+    # formatter machinery that comes with it) entirely. Anything else,
+    # including --help, goes through argparse as before.
+    if arg_list in (['--init-config'], ['--init-global-config']):
+        from ctxport.config import ConfigManager
+
+        args = argparse.Namespace(
+            init_config=arg_list[0] == '--init-config',
+            init_global_config=arg_list[0] == '--init-global-config',
+        )
+        handle_config_initialization(args, ConfigManager())
+        return 0
+
     parser = create_parser()
-    args = parser.parse_args(argv)
-    
+    args = parser.parse_args(arg_list)
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(levelname)s: %(message)s'
+    )
     if args.debug:
         logger.setLevel(logging.DEBUG)
     elif args.verbose:
         logger.setLevel(logging.INFO)
-    
+
+    # Deferred so --help, --version-style exits, and argument errors
+    # never pay for importing the config/exporter machinery.
+    from ctxport.config import ConfigManager
+    from ctxport.core import CodeExporter
+    from ctxport.utils.path_utils import normalize_path
+
     config_manager = ConfigManager()
     
     if handle_config_initialization(args, config_manager):
@@ -161,31 +230,42 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.error(f"Invalid directory: {e}")
         return 1
     
-    exporter = CodeExporter(config_manager)
+    exporter = CodeExporter(config_manager, max_workers=args.jobs)
     exporter.set_directory(root_dir)
     
-    try:
-        output_content, file_count = exporter.export_directory(args.verbose)
-    except Exception as e:
-        logger.error(f"Export failed: {e}")
-        return 1
-    
     if args.output:
         output_path = Path(args.output)
-        if write_to_file(output_path, output_content):
-            print(f"Successfully exported {file_count} files to: {output_path.resolve()}")
-        else:
+        try:
+            # Stream the export straight to the output file
+            with open(output_path, 'wb') as f:
+                _, file_count = exporter.export_directory(args.verbose, sink=f)
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
             return 1
+        print(f"Successfully exported {file_count} files to: {output_path.resolve()}")
     else:
+        from ctxport.core import ClipboardManager
+
         clipboard = ClipboardManager()
-        if clipboard.copy_to_clipboard(output_content):
-            print(f"Successfully copied {file_count} files to clipboard")
+        process = clipboard.open_stream()
+        if process is not None:
+            # Stream the export straight into the clipboard tool's stdin
+            try:
+                _, file_count = exporter.export_directory(args.verbose, sink=process.stdin)
+            except Exception as e:
+                # A tool that dies without draining its stdin surfaces
+                # here as a broken pipe mid-export
+                logger.error(f"Streamed export failed: {e}")
+                clipboard.close_stream(process)
+                return _recover_clipboard_failure(exporter, clipboard, args.verbose)
+            if clipboard.close_stream(process):
+                print(f"Successfully copied {file_count} files to clipboard")
+            else:
+                logger.error("Clipboard tool exited with an error")
+                return _recover_clipboard_failure(exporter, clipboard, args.verbose)
         else:
-            print("Error: Could not copy to clipboard. Printing to stdout instead:")
-            print("-" * 40)
-            print(output_content)
-            return 1
-    
+            return _recover_clipboard_failure(exporter, clipboard, args.verbose)
+
     return 0
 
 
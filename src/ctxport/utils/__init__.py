@@ -2,7 +2,7 @@
 Utility functions
 """
 
-from ctxport.utils.path_utils import find_files
+from ctxport.utils.path_utils import find_files, walk_entries
 from ctxport.utils.mime_utils import is_text_file
 
-__all__ = ["find_files", "is_text_file"]
\ No newline at end of file
+__all__ = ["find_files", "is_text_file", "walk_entries"]
\ No newline at end of file
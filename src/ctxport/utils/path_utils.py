@@ -5,29 +5,67 @@ Path utility functions for Code Context Exporter
 import logging
 import os
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Iterator, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
-def find_files(directory: Path) -> Generator[Path, None, None]:
+def walk_entries(
+    directory: Union[str, Path],
+    is_dir_ignored: Optional[Callable[[str], bool]] = None
+) -> Iterator[os.DirEntry]:
     """
-    Recursively find all files in a directory.
-    
+    Recursively walk a directory, optionally pruning ignored subtrees.
+
+    Directories for which is_dir_ignored returns True are never descended
+    into, so their contents are not even stat'd. Entries are sorted per
+    directory, giving a stable order without materializing (or globally
+    sorting) the whole tree, and symlinks are not followed.
+
     Args:
-        directory: The directory to search
-        
+        directory: The directory to walk
+        is_dir_ignored: Optional callback taking a directory name and
+            returning True if that subtree should be skipped
+
     Yields:
-        Paths for all files in the directory
+        DirEntry objects for all files under the directory
     """
     try:
-        for item in directory.rglob("*"):
-            if item.is_file():
-                yield item
+        entries = sorted(os.scandir(directory), key=lambda e: e.name)
     except PermissionError as e:
         logger.warning(f"Permission error accessing {directory}: {e}")
-    except Exception as e:
-        logger.error(f"Error finding files in {directory}: {e}")
+        return
+    except OSError as e:
+        logger.error(f"Error scanning {directory}: {e}")
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if is_dir_ignored is not None and is_dir_ignored(entry.name):
+                logger.debug(f"Pruning directory: {entry.path}")
+                continue
+            yield from walk_entries(entry.path, is_dir_ignored)
+        elif entry.is_file(follow_symlinks=False):
+            yield entry
+
+
+def find_files(
+    directory: Path,
+    is_dir_ignored: Optional[Callable[[str], bool]] = None
+) -> Generator[Path, None, None]:
+    """
+    Recursively find all files in a directory.
+
+    Args:
+        directory: The directory to search
+        is_dir_ignored: Optional callback taking a directory name and
+            returning True if that subtree should be skipped
+
+    Yields:
+        Paths for all files in the directory
+    """
+    for entry in walk_entries(directory, is_dir_ignored):
+        yield Path(entry.path)
 
 
 def safe_resolve(path: Path) -> Path:
@@ -57,9 +95,18 @@ def normalize_path(path_str: str) -> Path:
     Returns:
         Normalized Path object
     """
+    # Fast path: an absolute, tilde-free input needs no expansion and no
+    # cwd lookup. Callers needing canonicalization resolve afterwards
+    # anyway (see below).
+    if os.path.isabs(path_str) and '~' not in path_str:
+        return Path(path_str)
+
     expanded = os.path.expanduser(path_str)
-    
+
     if not os.path.isabs(expanded):
         expanded = os.path.abspath(expanded)
-    
-    return safe_resolve(Path(expanded))
+
+    # No resolve() here: that stats every component to chase symlinks,
+    # and callers that need a canonical path (CodeExporter.set_directory)
+    # resolve once themselves.
+    return Path(expanded)